@@ -3,7 +3,8 @@ from typing import NotRequired, Optional, Tuple, TypedDict, Union
 import torch
 from torch import nn
 
-from core.constants import DEVICE, WeightsInitializer
+from core.autocast import get_output_dtype
+from core.constants import WeightsInitializer
 from core.convlstm_cell import BaseConvLSTMCell
 
 
@@ -73,14 +74,24 @@ class ConvLSTM(nn.Module):
 
         # Initialize output
         output = torch.zeros(
-            (batch_size, self.out_channels, seq_len, height, width)
-        ).to(DEVICE)
+            (batch_size, self.out_channels, seq_len, height, width),
+            device=X.device,
+            dtype=get_output_dtype(X),
+        )
 
         # Initialize hidden state
-        h = torch.zeros((batch_size, self.out_channels, height, width)).to(DEVICE)
+        h = torch.zeros(
+            (batch_size, self.out_channels, height, width),
+            device=X.device,
+            dtype=X.dtype,
+        )
 
         # Initialize cell input
-        cell = torch.zeros((batch_size, self.out_channels, height, width)).to(DEVICE)
+        cell = torch.zeros(
+            (batch_size, self.out_channels, height, width),
+            device=X.device,
+            dtype=X.dtype,
+        )
 
         # Unroll over time steps
         for time_step in range(seq_len):
@@ -1,5 +1,5 @@
 import logging
-from typing import NotRequired, Optional, TypedDict
+from typing import NotRequired, Optional, Tuple, TypedDict
 
 import torch
 from torch import nn
@@ -17,6 +17,8 @@ class Seq2SeqParams(TypedDict):
     num_kernels: int
     return_sequences: NotRequired[bool]
     convlstm_params: ConvLSTMParams
+    compile: NotRequired[bool]
+    use_logits: NotRequired[bool]
 
 
 class Seq2Seq(nn.Module):
@@ -30,6 +32,8 @@ class Seq2Seq(nn.Module):
         convlstm_params: ConvLSTMParams,
         label_seq_length: Optional[int] = None,
         return_sequences: bool = False,
+        compile: bool = False,
+        use_logits: bool = False,
     ) -> None:
         """
 
@@ -39,6 +43,8 @@ class Seq2Seq(nn.Module):
             num_layers (int): Number of ConvLSTM layers.
             num_kernels (int): Number of kernels.
             return_sequences (int): If True, the model predict the next frames that is the same length of inputs. If False, the model predicts only one next frame or the frames given by `label_seq_length`.
+            compile (bool): If True, the layers are compiled with `torch.compile` so that the element-wise kernels (e.g. ConvLSTM gates, LayerNorm and activation) are fused.
+            use_logits (bool): If True, the model outputs logits without the final sigmoid (e.g. for `nn.BCEWithLogitsLoss`).
         """
         super().__init__()
         self.input_seq_length = input_seq_length
@@ -50,6 +56,7 @@ class Seq2Seq(nn.Module):
         self.num_layers = num_layers
         self.num_kernels = num_kernels
         self.return_sequences = return_sequences
+        self.use_logits = use_logits
         self.in_channels = convlstm_params["in_channels"]
         self.kernel_size = convlstm_params["kernel_size"]
         self.padding = convlstm_params["padding"]
@@ -111,11 +118,36 @@ class Seq2Seq(nn.Module):
             ),
         )
 
-        self.sequential.add_module("sigmoid", nn.Sigmoid())
+        if not self.use_logits:
+            self.sequential.add_module("sigmoid", nn.Sigmoid())
+
+        # NOTE: The layers of a single layer model (i.e. convlstm1, layernorm1, conv3d and the optional sigmoid)
+        # are called directly to skip the dispatch of nn.Sequential. Hooks and modules added to or replaced
+        # in `self.sequential` after construction are not seen by this path.
+        self._single_layer_modules: Optional[Tuple[nn.Module, nn.Module, nn.Module]] = (
+            None
+        )
+        if self.num_layers == 1 and not compile:
+            assert len(self.sequential) == (3 if self.use_logits else 4)
+            self._single_layer_modules = (
+                self.sequential.get_submodule("convlstm1"),
+                self.sequential.get_submodule("layernorm1"),
+                self.sequential.get_submodule("conv3d"),
+            )
+
+        if compile:
+            # NOTE: Compile in place to keep the keys of the state dict the same as the eager model.
+            self.sequential.compile(mode="reduce-overhead")
 
     def forward(self, X: torch.Tensor):
-        # Forward propagation through all the layers
-        output = self.sequential(X)
+        if self._single_layer_modules is not None:
+            convlstm, layernorm, conv3d = self._single_layer_modules
+            output = conv3d(layernorm(convlstm(X)))
+            if not self.use_logits:
+                output = output.sigmoid_()
+        else:
+            # Forward propagation through all the layers
+            output = self.sequential(X)
 
         if self.return_sequences is True:
             return output
@@ -0,0 +1,12 @@
+import torch
+
+
+def get_output_dtype(X: torch.Tensor) -> torch.dtype:
+    """Dtype of the output buffer of the recurrent layers for the input `X`.
+
+    Under autocast, the output is stored in the autocast dtype (e.g. bfloat16) so that
+    the following layers (e.g. LayerNorm) read and write half precision. Otherwise it is the dtype of `X`.
+    """
+    if torch.is_autocast_enabled(X.device.type):
+        return torch.get_autocast_dtype(X.device.type)
+    return X.dtype
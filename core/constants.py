@@ -1,9 +1,13 @@
+import os
 from enum import Enum
 
 import torch
 
 DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
 
+# Set `SA_CONVLSTM_CHANNELS_LAST_3D=0` to run Conv3d with the default NCDHW memory format.
+CHANNELS_LAST_3D = os.getenv("SA_CONVLSTM_CHANNELS_LAST_3D", "1") != "0"
+
 
 class WeightsInitializer(str, Enum):
     Zeros = "zeros"
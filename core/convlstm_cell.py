@@ -3,7 +3,31 @@ from typing import Tuple, Union
 import torch
 from torch import nn
 
-from core.constants import DEVICE, WeightsInitializer
+from core.constants import WeightsInitializer
+
+
+def _convlstm_gates(
+    conv_output: torch.Tensor,
+    prev_cell: torch.Tensor,
+    W_ci: torch.Tensor,
+    W_cf: torch.Tensor,
+    W_co: torch.Tensor,
+    activation: nn.Module,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    i_conv, f_conv, c_conv, o_conv = torch.chunk(conv_output, chunks=4, dim=1)
+
+    input_gate = torch.sigmoid(i_conv + W_ci * prev_cell)
+    forget_gate = torch.sigmoid(f_conv + W_cf * prev_cell)
+
+    # Current cell output (state)
+    C = forget_gate * prev_cell + input_gate * activation(c_conv)
+
+    output_gate = torch.sigmoid(o_conv + W_co * C)
+
+    # Current hidden state
+    H = output_gate * activation(C)
+
+    return H, C
 
 
 class BaseConvLSTMCell(nn.Module):
@@ -36,18 +60,17 @@ class BaseConvLSTMCell(nn.Module):
             out_channels=4 * out_channels,
             kernel_size=kernel_size,
             padding=padding,
-            device=DEVICE,
         )
 
         self.W_ci = nn.parameter.Parameter(
             torch.zeros(out_channels, *frame_size, dtype=torch.float)
-        ).to(DEVICE)
+        )
         self.W_co = nn.parameter.Parameter(
             torch.zeros(out_channels, *frame_size, dtype=torch.float)
-        ).to(DEVICE)
+        )
         self.W_cf = nn.parameter.Parameter(
             torch.zeros(out_channels, *frame_size, dtype=torch.float)
-        ).to(DEVICE)
+        )
         self.__initialize_weights(weights_initializer)
 
     def __activation(self, activation: str) -> nn.Module:
@@ -101,17 +124,8 @@ class BaseConvLSTMCell(nn.Module):
         """
         conv_output = self.conv(torch.cat([X, prev_h], dim=1))
 
-        i_conv, f_conv, c_conv, o_conv = torch.chunk(conv_output, chunks=4, dim=1)
-
-        input_gate = torch.sigmoid(i_conv + self.W_ci * prev_cell)
-        forget_gate = torch.sigmoid(f_conv + self.W_cf * prev_cell)
-
-        # Current cell output (state)
-        C = forget_gate * prev_cell + input_gate * self.activation(c_conv)
-
-        output_gate = torch.sigmoid(o_conv + self.W_co * C)
-
-        # Current hidden state
-        H = output_gate * self.activation(C)
+        H, C = _convlstm_gates(
+            conv_output, prev_cell, self.W_ci, self.W_cf, self.W_co, self.activation
+        )
 
-        return H.to(DEVICE), C.to(DEVICE)
+        return H, C
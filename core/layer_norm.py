@@ -0,0 +1,58 @@
+import torch
+from torch.nn import functional as F
+
+try:
+    # NOTE: apex's fused kernel is much faster than `nn.LayerNorm` on GPU.
+    from apex.normalization import FusedLayerNorm as LayerNorm
+
+    APEX_AVAILABLE = True
+except ImportError:
+    from torch.nn import LayerNorm  # type: ignore
+
+    APEX_AVAILABLE = False
+
+
+class ChannelLayerNorm(LayerNorm):
+    """LayerNorm over the channel dimension of the sequence of frames.
+
+    Each pixel of each frame is normalized independently, so the reduction size is
+    `num_channels` instead of `num_channels * seq_len * height * width`.
+    The input is laid out as (batch_size, seq_len, height, width, num_channels) so that
+    the normalized dimension is contiguous, and the output keeps that layout
+    (i.e. channels_last_3d memory format).
+    """
+
+    def __init__(self, num_channels: int, eps: float = 1e-5) -> None:
+        """
+
+        Args:
+            num_channels (int): Number of channels of input tensor.
+            eps (float): A value added to the denominator for numerical stability.
+        """
+        super().__init__(num_channels, eps=eps)
+
+    def forward(self, X: torch.Tensor) -> torch.Tensor:
+        """
+
+        Args:
+            X (torch.Tensor): tensor with the shape of (batch_size, num_channels, seq_len, height, width)
+
+        Returns:
+            torch.Tensor: tensor with the same shape of X
+        """
+        X = X.permute(0, 2, 3, 4, 1).contiguous()
+        if not APEX_AVAILABLE and torch.is_autocast_enabled(X.device.type):
+            # NOTE: Autocast runs `layer_norm` in float32, which doubles the memory traffic
+            # of half precision input. The kernel accumulates the statistics in float32
+            # regardless of the input dtype, so the input dtype is kept instead.
+            with torch.autocast(X.device.type, enabled=False):
+                X = F.layer_norm(
+                    X,
+                    self.normalized_shape,
+                    self.weight.to(X.dtype),
+                    self.bias.to(X.dtype),
+                    self.eps,
+                )
+        else:
+            X = super().forward(X)
+        return X.permute(0, 4, 1, 2, 3)
@@ -1,11 +1,55 @@
 import math
-from typing import List, Tuple, Union
+import os
+from typing import List, Sequence, Tuple, Union
 
 import torch
-from torch.utils.data import DataLoader, Dataset, Subset, random_split
+from torch import distributed as dist
+from torch.utils.data import (
+    BatchSampler,
+    DataLoader,
+    Dataset,
+    DistributedSampler,
+    RandomSampler,
+    Sampler,
+    SequentialSampler,
+    Subset,
+    random_split,
+)
 from torchvision.datasets import MovingMNIST
 
+from core.constants import DEVICE
 from data_loaders.base import BaseDataLoaders
+from pipelines.utils.distributed_utils import local_main_process_first
+
+MAX_NUM_WORKERS = 4
+
+
+class FramesDataset(Dataset):
+    """Sequences of frames held in a single tensor.
+
+    Indexing with a list of indices gathers the whole batch at once,
+    so that no per-sample `__getitem__` call and collation is needed.
+    """
+
+    def __init__(self, frames: torch.Tensor, indices: Sequence[int]):
+        """
+
+        Args:
+            frames (torch.Tensor): tensor with the shape of (num_sequences, seq_len, num_channels, height, width).
+                uint8 frames are scaled into [0, 1] when indexed.
+            indices (Sequence[int]): Indices of the sequences which belong to this dataset.
+        """
+        self.frames = frames
+        self.indices = torch.as_tensor(indices, dtype=torch.long)
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, idx: Union[int, List[int]]) -> torch.Tensor:
+        frames = self.frames[self.indices[idx]]
+        if frames.dtype == torch.uint8:
+            return frames / 255.0
+        return frames
 
 
 class VideoPredictionDataset(Dataset):
@@ -22,14 +66,19 @@ class VideoPredictionDataset(Dataset):
     def __len__(self):
         return len(self.data)
 
-    def __getitem__(self, idx: int) -> Tuple[torch.Tensor, torch.Tensor]:
-        input_frames = self.data[idx][: self.input_frames, :, :, :].to(torch.float32)
-        label_frames = self.data[idx][self.input_frames :, :, :, :].to(torch.float32)
+    def __getitem__(
+        self, idx: Union[int, List[int]]
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        # NOTE: `idx` is a list of indices when a batch is loaded at once,
+        # so the frames are sliced from the end of the shape.
+        frames = self.data[idx]
+        input_frames = frames[..., : self.input_frames, :, :, :].to(torch.float32)
+        label_frames = frames[..., self.input_frames :, :, :, :].to(torch.float32)
         if self.label_frames is not None:
-            label_frames = label_frames[: self.label_frames, :]
+            label_frames = label_frames[..., : self.label_frames, :, :, :]
         return (
-            torch.swapaxes(input_frames, 0, 1),
-            torch.swapaxes(label_frames, 0, 1),
+            torch.swapaxes(input_frames, -4, -3),
+            torch.swapaxes(label_frames, -4, -3),
         )
 
 
@@ -42,12 +91,21 @@ class MovingMNISTDataLoaders(BaseDataLoaders):
         label_frames: int | None = None,
         split_ratios: List[float] | None = None,
         shuffle: bool = True,
+        num_workers: int | None = None,
     ):
         self.train_batch_size = train_batch_size
         self.validation_batch_size = validation_batch_size
         self.input_frames = input_frames
         self.label_frames = label_frames
         self.shuffle = shuffle
+        if num_workers is None:
+            # NOTE: The CPUs are shared by the processes on the same node in distributed training,
+            # and each of the train and validation loaders keeps its own workers.
+            local_world_size = int(os.environ.get("LOCAL_WORLD_SIZE", 1))
+            num_workers = min(
+                (os.cpu_count() or 0) // (2 * local_world_size), MAX_NUM_WORKERS
+            )
+        self.num_workers = num_workers
         if split_ratios is None:
             split_ratios = [0.7, 0.2, 0.1]
         if not math.isclose(sum(split_ratios), 1) and sum(split_ratios) > 1:
@@ -56,36 +114,70 @@ class MovingMNISTDataLoaders(BaseDataLoaders):
             )
         self.split_ratios = split_ratios
 
-        moving_mnist = MovingMNIST(
-            root="./data", download=True, transform=lambda x: x / 255.0
-        )
-        train_dataset, valid_dataset, test_dataset = random_split(
-            moving_mnist,
+        # NOTE: MovingMNIST already holds all the sequences (10000x20x1x64x64 uint8, ~820MB)
+        # in a single tensor, so batches are sliced from it instead of loaded per sample.
+        # NOTE: Only one process per node downloads the dataset in distributed training.
+        with local_main_process_first():
+            moving_mnist = MovingMNIST(root="./data", download=True)
+        frames = torch.as_tensor(moving_mnist.data)
+        train_indices, valid_indices, test_indices = random_split(
+            FramesDataset(frames, range(len(frames))),
             [*self.split_ratios],
             generator=torch.Generator().manual_seed(42),
         )
         self.train_dataset = VideoPredictionDataset(
-            train_dataset, self.input_frames, self.label_frames
+            FramesDataset(frames, train_indices.indices),
+            self.input_frames,
+            self.label_frames,
         )
         self.valid_dataset = VideoPredictionDataset(
-            valid_dataset, self.input_frames, self.label_frames
+            FramesDataset(frames, valid_indices.indices),
+            self.input_frames,
+            self.label_frames,
+        )
+        self.test_dataset = VideoPredictionDataset(
+            FramesDataset(frames, test_indices.indices), self.input_frames
         )
-        self.test_dataset = VideoPredictionDataset(test_dataset, self.input_frames)
 
     @property
     def train_dataloader(self) -> DataLoader:
-        return DataLoader(
-            self.train_dataset, batch_size=self.train_batch_size, shuffle=self.shuffle
+        return self.__dataloader(
+            self.train_dataset, self.train_batch_size, distributed=True
         )
 
     @property
     def validation_dataloader(self) -> DataLoader:
-        return DataLoader(
-            self.valid_dataset,
-            batch_size=self.validation_batch_size,
-            shuffle=self.shuffle,
+        return self.__dataloader(
+            self.valid_dataset, self.validation_batch_size, distributed=True
         )
 
     @property
     def test_dataloader(self) -> DataLoader:
-        return DataLoader(self.test_dataset, batch_size=1, shuffle=self.shuffle)
+        return self.__dataloader(self.test_dataset, 1)
+
+    def __dataloader(
+        self,
+        dataset: VideoPredictionDataset,
+        batch_size: int,
+        distributed: bool = False,
+    ) -> DataLoader:
+        # NOTE: Each process loads its own shard of the dataset in distributed training.
+        sampler: Sampler
+        if distributed and dist.is_initialized():
+            sampler = DistributedSampler(dataset, shuffle=self.shuffle)
+        elif self.shuffle:
+            sampler = RandomSampler(dataset)
+        else:
+            sampler = SequentialSampler(dataset)
+        # NOTE: Each batch is fetched with a single list of indices (`batch_size=None` disables collation).
+        # Batches are loaded in background workers into pinned memory
+        # so that they can be copied to GPU asynchronously.
+        return DataLoader(
+            dataset,
+            batch_size=None,
+            sampler=BatchSampler(sampler, batch_size, drop_last=False),
+            num_workers=self.num_workers,
+            pin_memory=DEVICE == "cuda",
+            persistent_workers=self.num_workers > 0,
+            prefetch_factor=4 if self.num_workers > 0 else None,
+        )
@@ -1,15 +1,20 @@
+import torch
 from torch import nn
 from torch.optim import Adam
 
 from convlstm.seq2seq import Seq2Seq, Seq2SeqParams
-from core.constants import WeightsInitializer
+from core.constants import DEVICE, WeightsInitializer
 from data_loaders.moving_mnist import MovingMNISTDataLoaders
 from pipelines.experimenter import Experimenter
 from pipelines.trainer import TrainingParams
+from pipelines.utils.distributed_utils import setup_distributed
 from pipelines.utils.early_stopping import EarlyStopping
 
 
 def main():
+    # Run on multiple GPUs with `torchrun --nproc-per-node=<NUM_GPUS> -m examples.moving_mnist_convlstm`.
+    setup_distributed()
+
     ###
     # Common Params
     ###
@@ -34,21 +39,38 @@ def main():
             "frame_size": (64, 64),
             "weights_initializer": WeightsInitializer.He,
         },
+        "compile": DEVICE == "cuda",
+        "use_logits": True,
     }
 
-    model = Seq2Seq(**model_params)
+    # NOTE: Build and initialize the model on CPU, then move it to the device at once.
+    model = Seq2Seq(**model_params).to(DEVICE)
+
+    autocast_dtype = None
+    if DEVICE == "cuda":
+        torch.backends.cudnn.benchmark = True
+        # Use bfloat16 where the GPU supports it natively, otherwise float16 with loss scaling.
+        autocast_dtype = (
+            torch.bfloat16
+            if torch.cuda.is_bf16_supported(including_emulation=False)
+            else torch.float16
+        )
+        # Use TF32 matmul on Ampere or later GPUs.
+        if torch.cuda.get_device_capability()[0] >= 8:
+            torch.set_float32_matmul_precision("high")
 
     training_params: TrainingParams = {
         "epochs": 1,
-        "loss_criterion": nn.BCELoss(reduction="sum"),
+        "loss_criterion": nn.BCEWithLogitsLoss(reduction="sum"),
         "accuracy_criterion": nn.L1Loss(),
-        "optimizer": Adam(model.parameters(), lr=1e-4),
+        "optimizer": Adam(model.parameters(), lr=1e-4, fused=DEVICE == "cuda"),
         "early_stopping": EarlyStopping(
             patience=30,
             verbose=True,
             delta=0.0001,
         ),
         "metrics_filename": "metrics.csv",
+        "autocast_dtype": autocast_dtype,
     }
 
     print("Loading dataset ...")
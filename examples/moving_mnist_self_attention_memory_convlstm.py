@@ -1,7 +1,7 @@
 from torch import nn
 from torch.optim import Adam
 
-from core.constants import WeightsInitializer
+from core.constants import DEVICE, WeightsInitializer
 from data_loaders.moving_mnist import MovingMNISTDataLoaders
 from pipelines.experimenter import Experimenter
 from pipelines.trainer import TrainingParams
@@ -35,15 +35,17 @@ def main():
             "frame_size": (64, 64),
             "weights_initializer": WeightsInitializer.He,
         },
+        "compile": DEVICE == "cuda",
+        "use_logits": True,
     }
 
-    model = SAMSeq2Seq(**model_params)
+    model = SAMSeq2Seq(**model_params).to(DEVICE)
 
     training_params: TrainingParams = {
         "epochs": 1,
-        "loss_criterion": nn.BCELoss(reduction="sum"),
+        "loss_criterion": nn.BCEWithLogitsLoss(reduction="sum"),
         "accuracy_criterion": nn.L1Loss(),
-        "optimizer": Adam(model.parameters(), lr=1e-4),
+        "optimizer": Adam(model.parameters(), lr=1e-4, fused=DEVICE == "cuda"),
         "early_stopping": EarlyStopping(
             patience=30,
             verbose=True,
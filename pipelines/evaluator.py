@@ -26,9 +26,17 @@ class Evaluator(BaseRunner):
         os.makedirs(artifact_dir, exist_ok=True)
         self.artifact_dir = artifact_dir
         self.save_attention_maps = save_attention_maps
+        if save_attention_maps:
+            set_store_attention_maps = getattr(
+                self.model, "set_store_attention_maps", None
+            )
+            if callable(set_store_attention_maps):
+                set_store_attention_maps(True)
 
     def run(self):
-        with torch.no_grad():
+        self.model.eval()
+        # NOTE: Inference mode also skips the version counter and view tracking of autograd.
+        with torch.inference_mode():
             for batch_idx, (input, label) in enumerate(self.test_dataloader):
                 pred_frames = self.__predict_frames(input, label)
                 save_pred_vs_label_images(
@@ -47,20 +55,27 @@ class Evaluator(BaseRunner):
     def __predict_frames(
         self, input: torch.Tensor, label: torch.Tensor
     ) -> torch.Tensor:
-        input, label = input.to(DEVICE), label.to(DEVICE)
+        input = input.to(DEVICE, non_blocking=True)
+        label = label.to(DEVICE, non_blocking=True)
         if self.model.return_sequences:
-            return self.model(input)
+            return self.__predict(input)
 
         # Generate prediction frames with updating input data sequentially.
         pred_frames = torch.zeros(label.size(), dtype=torch.float, device=DEVICE)
         for frame_idx in range(input.size(2)):
             if frame_idx == 0:
-                pred_frames[:, :, frame_idx] = self.model(input)
+                pred_frames[:, :, frame_idx] = self.__predict(input)
             else:
-                pred_frames[:, :, frame_idx] = self.model(
+                pred_frames[:, :, frame_idx] = self.__predict(
                     torch.cat(
                         (input[:, :, frame_idx:], label[:, :, :frame_idx]),
                         2,
                     )
                 )
         return pred_frames
+
+    def __predict(self, input: torch.Tensor) -> torch.Tensor:
+        output = self.model(input)
+        if getattr(self.model, "use_logits", False):
+            return torch.sigmoid(output)
+        return output
@@ -7,6 +7,7 @@ from data_loaders.base import BaseDataLoaders
 from pipelines.base import BaseRunner
 from pipelines.evaluator import Evaluator
 from pipelines.trainer import Trainer, TrainingParams
+from pipelines.utils.distributed_utils import is_main_process
 
 
 class Experimenter(BaseRunner):
@@ -40,7 +41,8 @@ class Experimenter(BaseRunner):
 
     def run(self):
         self.__train()
-        self.__evaluate()
+        if is_main_process():
+            self.__evaluate()
 
     def __train(self):
         print(f"Training {self._model.__class__.__name__} ...")
@@ -57,6 +59,7 @@ class Experimenter(BaseRunner):
             artifact_dir=os.path.join(self._artifact_dir, "train"),
             metrics_filename=self._training_params.get("metrics_filename")
             or "metrics.csv",
+            autocast_dtype=self._training_params.get("autocast_dtype"),
         )
         trainer.run()
 
@@ -3,13 +3,15 @@ from typing import Callable, Dict, List, NotRequired, Optional, TypedDict, cast
 
 import pandas as pd
 import torch
-from torch import nn
+from torch import distributed as dist, nn
 from torch.nn.modules.loss import _Loss
+from torch.nn.parallel import DistributedDataParallel
 from torch.optim import Optimizer
-from torch.utils.data import DataLoader
+from torch.utils.data import BatchSampler, DataLoader, DistributedSampler
 
 from core.constants import DEVICE
 from pipelines.base import BaseRunner
+from pipelines.utils.distributed_utils import all_reduce_mean, is_main_process
 from pipelines.utils.early_stopping import EarlyStopping
 from pipelines.utils.visualize_utils import save_learning_curve_plot
 
@@ -21,6 +23,7 @@ class TrainingParams(TypedDict):
     optimizer: nn.Module
     early_stopping: EarlyStopping
     metrics_filename: NotRequired[str]
+    autocast_dtype: NotRequired[Optional[torch.dtype]]
 
 
 class TrainingMetrics(TypedDict):
@@ -42,8 +45,19 @@ class Trainer(BaseRunner):
         early_stopping: EarlyStopping,
         artifact_dir: str,
         metrics_filename: str = "training_metrics.csv",
+        autocast_dtype: Optional[torch.dtype] = None,
     ) -> None:
         self.model = model.to(DEVICE)
+        # NOTE: Gradients are all-reduced in buckets while backward is running.
+        self._train_model = (
+            DistributedDataParallel(
+                self.model,
+                device_ids=[torch.cuda.current_device()] if DEVICE == "cuda" else None,
+                gradient_as_bucket_view=True,
+            )
+            if dist.is_initialized()
+            else self.model
+        )
         self.train_epochs = train_epochs
         self.train_dataloader = train_dataloader
         self.validation_dataloader = validation_dataloader
@@ -57,6 +71,11 @@ class Trainer(BaseRunner):
         if not metrics_filename.endswith(".csv"):
             raise ValueError("`save_metrics_filename` should be end with `.csv`")
         self.metrics_filename = metrics_filename
+        self.autocast_dtype = autocast_dtype
+        # NOTE: Gradient scaling is only needed for float16 because of its narrow exponent range.
+        self.grad_scaler = torch.amp.GradScaler(
+            DEVICE, enabled=autocast_dtype == torch.float16
+        )
         self._training_metrics: TrainingMetrics = {
             "train_loss": [],
             "validation_loss": [],
@@ -65,6 +84,11 @@ class Trainer(BaseRunner):
 
     def run(self) -> None:
         for epoch in range(1, self.train_epochs + 1):
+            sampler = self.train_dataloader.sampler
+            if isinstance(sampler, BatchSampler):
+                sampler = sampler.sampler
+            if isinstance(sampler, DistributedSampler):
+                sampler.set_epoch(epoch)
             self.__train()
             self.__validation()
             training_metric = self.__latest_training_metric()
@@ -83,7 +107,9 @@ class Trainer(BaseRunner):
                 print(f"Early stopped at epoch {epoch}")
                 break
 
-        self._save_artifacts()
+        self.early_stopping.wait_for_checkpoint()
+        if is_main_process():
+            self._save_artifacts()
 
     @property
     def training_metrics(self) -> TrainingMetrics:
@@ -93,34 +119,53 @@ class Trainer(BaseRunner):
         train_loss = 0
         self.model.train()
         for _, (input, target) in enumerate(self.train_dataloader, start=1):
-            input, target = input.to(DEVICE), target.to(DEVICE)
+            input = input.to(DEVICE, non_blocking=True)
+            target = target.to(DEVICE, non_blocking=True)
 
-            output = self.model(input)
-            loss = self.loss_criterion(output.flatten(), target.flatten())
+            with self.__autocast():
+                output = self._train_model(input)
+            # NOTE: Loss is calculated in float32 because some criterions (e.g. BCELoss) are not autocast safe.
+            loss = self.loss_criterion(output.float().flatten(), target.flatten())
 
             self.optimizer.zero_grad()
-            loss.backward()
-            self.optimizer.step()
+            self.grad_scaler.scale(loss).backward()
+            self.grad_scaler.step(self.optimizer)
+            self.grad_scaler.update()
 
             train_loss += loss.item()
 
-        self.__log_metric(train_loss=train_loss / len(self.train_dataloader))
+        self.__log_metric(
+            train_loss=all_reduce_mean(train_loss / len(self.train_dataloader))
+        )
 
     def __validation(self):
         valid_loss, valid_acc = 0, 0
         self.model.eval()
         with torch.no_grad():
             for input, target in self.validation_dataloader:
-                input, target = input.to(DEVICE), target.to(DEVICE)
-                output = self.model(input)
+                input = input.to(DEVICE, non_blocking=True)
+                target = target.to(DEVICE, non_blocking=True)
+                with self.__autocast():
+                    output = self.model(input).float()
                 loss = self.loss_criterion(output.flatten(), target.flatten())
+                # NOTE: The accuracy is measured on probabilities even if the model outputs logits.
+                if getattr(self.model, "use_logits", False):
+                    output = torch.sigmoid(output)
                 acc = self.accuracy_criterion(output.flatten(), target.flatten())
                 valid_loss += loss.item()
                 valid_acc += acc.item()
         dataset_length = len(self.validation_dataloader)
+        # NOTE: Metrics are averaged over processes so that all of them make the same early stopping decision.
         self.__log_metric(
-            validation_loss=valid_loss / dataset_length,
-            validation_accuracy=valid_acc / dataset_length,
+            validation_loss=all_reduce_mean(valid_loss / dataset_length),
+            validation_accuracy=all_reduce_mean(valid_acc / dataset_length),
+        )
+
+    def __autocast(self) -> torch.autocast:
+        return torch.autocast(
+            device_type=DEVICE,
+            dtype=self.autocast_dtype,
+            enabled=self.autocast_dtype is not None,
         )
 
     def __log_metric(
@@ -0,0 +1,50 @@
+import os
+from contextlib import contextmanager
+from typing import Iterator
+
+import torch
+from torch import distributed as dist
+
+from core.constants import DEVICE
+
+
+def setup_distributed() -> None:
+    """Initialize the default process group if the script is launched by `torchrun`."""
+    if "LOCAL_RANK" not in os.environ or dist.is_initialized():
+        return
+
+    if DEVICE == "cuda":
+        torch.cuda.set_device(int(os.environ["LOCAL_RANK"]))
+    dist.init_process_group("nccl" if DEVICE == "cuda" else "gloo")
+
+
+def is_main_process() -> bool:
+    return not dist.is_initialized() or dist.get_rank() == 0
+
+
+def all_reduce_mean(value: float) -> float:
+    """Average the given value over all processes."""
+    if not dist.is_initialized():
+        return value
+
+    tensor = torch.tensor(value, dtype=torch.float, device=DEVICE)
+    dist.all_reduce(tensor)
+    return tensor.item() / dist.get_world_size()
+
+
+@contextmanager
+def local_main_process_first() -> Iterator[None]:
+    """Run the block on the main process of each node first, then on the other processes.
+
+    This lets the main process prepare shared files (e.g. download a dataset) before the others read them.
+    """
+    if not dist.is_initialized():
+        yield
+        return
+
+    is_local_main_process = int(os.environ.get("LOCAL_RANK", 0)) == 0
+    if not is_local_main_process:
+        dist.barrier()
+    yield
+    if is_local_main_process:
+        dist.barrier()
@@ -1,9 +1,13 @@
-from typing import Callable, Optional
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
 
 import numpy as np
 import torch
 from torch import nn
 
+from pipelines.utils.distributed_utils import is_main_process
+
 
 class EarlyStopping:
     def __init__(
@@ -36,6 +40,11 @@ class EarlyStopping:
         self.model_save_path = model_save_path
         self.trace_func = trace_func
         self.state_dict = None
+        # NOTE: Checkpoints are written in background not to block the training loop.
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._checkpoint_future: Optional[Future] = None
+        # NOTE: Host buffers of the checkpoint, which are reused over checkpoints.
+        self._host_state_dict: Dict[str, torch.Tensor] = {}
 
     def __call__(self, val_loss: float, model: nn.Module):
         score = -val_loss
@@ -59,5 +68,60 @@ class EarlyStopping:
                 f"Validation loss decreased ({self.val_loss_min:.6f} --> {val_loss:.6f}). Saving model ..."
             )
 
-        torch.save(model.state_dict(), self.model_save_path)
+        if is_main_process():
+            # The host buffers are reused, so wait until the previous checkpoint is written.
+            self.wait_for_checkpoint()
+            state_dict, copy_event = self.__copy_to_host(model)
+            self._checkpoint_future = self._executor.submit(
+                self.__save_state_dict, state_dict, copy_event
+            )
         self.val_loss_min = val_loss
+
+    def wait_for_checkpoint(self) -> None:
+        """Block until the checkpoint being written in background is saved."""
+        if self._checkpoint_future is not None:
+            self._checkpoint_future.result()
+            self._checkpoint_future = None
+
+    def __copy_to_host(
+        self, model: nn.Module
+    ) -> Tuple[Dict[str, torch.Tensor], Optional[torch.cuda.Event]]:
+        """Copy the parameters into host memory because they are updated while the checkpoint is being written.
+
+        GPU tensors are copied asynchronously into pinned memory, so the returned event
+        should be synchronized before the copies are read.
+        """
+        state_dict = {}
+        copy_event = None
+        for key, value in model.state_dict().items():
+            value = value.detach()
+            buffer = self._host_state_dict.get(key)
+            if (
+                buffer is None
+                or buffer.shape != value.shape
+                or buffer.dtype != value.dtype
+            ):
+                buffer = torch.empty(
+                    value.shape, dtype=value.dtype, pin_memory=value.is_cuda
+                )
+                self._host_state_dict[key] = buffer
+            buffer.copy_(value, non_blocking=value.is_cuda)
+            state_dict[key] = buffer
+            if value.is_cuda and copy_event is None:
+                copy_event = torch.cuda.Event()
+
+        if copy_event is not None:
+            copy_event.record()
+        return state_dict, copy_event
+
+    def __save_state_dict(
+        self,
+        state_dict: Dict[str, torch.Tensor],
+        copy_event: Optional[torch.cuda.Event],
+    ) -> None:
+        if copy_event is not None:
+            copy_event.synchronize()
+        # Write to a temporary file and rename it not to leave a corrupted checkpoint.
+        tmp_path = f"{self.model_save_path}.tmp"
+        torch.save(state_dict, tmp_path)
+        os.replace(tmp_path, self.model_save_path)
@@ -88,6 +88,9 @@ def save_attention_maps(save_dir_path: str, model: nn.Module) -> None:
     # NOTE: attention maps shape is (batch_size=1, frames, height * width)
     # Extracted only center attention map because of memory usage.
     for layer_name, attention_maps in get_attention_maps().items():
+        # Skip the layers which do not store attention maps.
+        if attention_maps is None:
+            continue
         layer_name = layer_name.split(".")[-1]
         save_dir = os.path.join(save_dir_path, layer_name)
         os.makedirs(save_dir, exist_ok=True)
@@ -38,10 +38,14 @@ class SAConvLSTMCell(nn.Module):
         self.attention_h = SelfAttention(out_channels, attention_hidden_dims)
 
     def forward(
-        self, X: torch.Tensor, prev_h: torch.Tensor, prev_cell: torch.Tensor
+        self,
+        X: torch.Tensor,
+        prev_h: torch.Tensor,
+        prev_cell: torch.Tensor,
+        return_attention: bool = False,
     ) -> Tuple:
         X, _ = self.attention_x(X)
         new_h, new_cell = self.convlstm_cell(X, prev_h, prev_cell)
-        new_h, attention = self.attention_h(new_h)
+        new_h, attention = self.attention_h(new_h, return_attention)
         new_h += new_h
         return new_h, new_cell, attention
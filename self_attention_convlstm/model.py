@@ -4,7 +4,7 @@ import torch
 from torch import nn
 
 from convlstm.model import ConvLSTMParams
-from core.constants import DEVICE
+from core.autocast import get_output_dtype
 from self_attention_convlstm.cell import SAConvLSTMCell
 
 
@@ -34,6 +34,9 @@ class SAConvLSTM(nn.Module):
         )
 
         self._attention_scores: Optional[torch.Tensor] = None
+        # NOTE: Storing attention maps needs the full attention matrix instead of the fused kernel,
+        # so they are stored only when explicitly requested (e.g. for visualization).
+        self.store_attention_maps = False
 
     @property
     def attention_scores(self) -> Optional[torch.Tensor]:
@@ -49,30 +52,45 @@ class SAConvLSTM(nn.Module):
 
         # NOTE: Cannot store all attention scores because of memory. So only store attention map of the center.
         # And the same attention score are applied to each channels.
-        self._attention_scores = torch.zeros(
-            (batch_size, seq_len, height * width), device=DEVICE
+        # Reset the scores otherwise not to return the ones of a previous input.
+        self._attention_scores = (
+            torch.zeros(
+                (batch_size, seq_len, height * width), device=X.device, dtype=X.dtype
+            )
+            if self.store_attention_maps
+            else None
         )
 
         if h is None:
             h = torch.zeros(
-                (batch_size, self.out_channels, height, width), device=DEVICE
+                (batch_size, self.out_channels, height, width),
+                device=X.device,
+                dtype=X.dtype,
             )
 
         if cell is None:
             cell = torch.zeros(
-                (batch_size, self.out_channels, height, width), device=DEVICE
+                (batch_size, self.out_channels, height, width),
+                device=X.device,
+                dtype=X.dtype,
             )
 
         output = torch.zeros(
-            (batch_size, self.out_channels, seq_len, height, width), device=DEVICE
+            (batch_size, self.out_channels, seq_len, height, width),
+            device=X.device,
+            dtype=get_output_dtype(X),
         )
 
         for time_step in range(seq_len):
-            h, cell, attention = self.sa_convlstm_cell(X[:, :, time_step], h, cell)
+            h, cell, attention = self.sa_convlstm_cell(
+                X[:, :, time_step], h, cell, return_attention=self.store_attention_maps
+            )
 
             output[:, :, time_step] = h  # type: ignore
-            self._attention_scores[:, time_step] = attention[
-                :, attention.size(0) // 2
-            ]  # attention shape is (batch_size, height*width, height*width)
+            if self._attention_scores is not None and attention is not None:
+                # Detach attention maps not to keep the computational graph alive.
+                self._attention_scores[:, time_step] = attention[
+                    :, attention.size(0) // 2
+                ].detach()  # attention shape is (batch_size, height*width, height*width)
 
         return output
@@ -1,9 +1,8 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 import torch
 from torch import nn
-
-from core.constants import DEVICE
+from torch.nn import functional as F
 
 
 class SelfAttention(nn.Module):
@@ -11,17 +10,26 @@ class SelfAttention(nn.Module):
 
     def __init__(self, input_dim: int, hidden_dim: int) -> None:
         super().__init__()
-        self.query_h = nn.Conv2d(
-            input_dim, hidden_dim, 1, padding="same", device=DEVICE
-        )
-        self.key_h = nn.Conv2d(input_dim, hidden_dim, 1, padding="same", device=DEVICE)
-        self.value_h = nn.Conv2d(input_dim, input_dim, 1, padding="same", device=DEVICE)
-        self.z = nn.Conv2d(input_dim, input_dim, 1, padding="same", device=DEVICE)
+        self.query_h = nn.Conv2d(input_dim, hidden_dim, 1, padding="same")
+        self.key_h = nn.Conv2d(input_dim, hidden_dim, 1, padding="same")
+        self.value_h = nn.Conv2d(input_dim, input_dim, 1, padding="same")
+        self.z = nn.Conv2d(input_dim, input_dim, 1, padding="same")
 
         self.input_dim = input_dim
         self.hidden_dim = hidden_dim
 
-    def forward(self, h) -> Tuple:
+    def forward(
+        self, h: torch.Tensor, return_attention: bool = False
+    ) -> Tuple[torch.Tensor, Optional[torch.Tensor]]:
+        """
+
+        Args:
+            h (torch.Tensor): tensor with the shape of (batch_size, input_dim, height, width)
+            return_attention (bool): If True, the attention matrix is calculated and returned. Otherwise None is returned instead.
+
+        Returns:
+            Tuple[torch.Tensor, Optional[torch.Tensor]]: (new_h, attention)
+        """
         batch_size, _, H, W = h.shape
         k_h = self.key_h(h)
         q_h = self.query_h(h)
@@ -31,11 +39,22 @@ class SelfAttention(nn.Module):
         q_h = q_h.view(batch_size, self.hidden_dim, H * W).transpose(1, 2)
         v_h = v_h.view(batch_size, self.input_dim, H * W)
 
-        attention = torch.softmax(
-            torch.bmm(q_h, k_h), dim=-1
-        )  # the shape is (batch_size, H*W, H*W)
-
-        new_h = torch.matmul(attention, v_h.permute(0, 2, 1))
+        attention: Optional[torch.Tensor] = None
+        if return_attention:
+            attention = torch.softmax(
+                torch.bmm(q_h, k_h), dim=-1
+            )  # the shape is (batch_size, H*W, H*W)
+            new_h = torch.matmul(attention, v_h.permute(0, 2, 1))
+        else:
+            # NOTE: SDPA runs fused kernels (e.g. memory-efficient attention) without materializing the attention matrix.
+            # The fused kernels only accept 4-D input, so a single head dimension is added.
+            # `scale=1.0` because the attention scores are not scaled in this module.
+            new_h = F.scaled_dot_product_attention(
+                q_h.unsqueeze(1),
+                k_h.transpose(1, 2).unsqueeze(1),
+                v_h.transpose(1, 2).unsqueeze(1),
+                scale=1.0,
+            ).squeeze(1)
         new_h = new_h.transpose(1, 2).view(batch_size, self.input_dim, H, W)
         new_h = self.z(new_h)
 
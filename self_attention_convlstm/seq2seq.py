@@ -1,9 +1,11 @@
-from typing import NotRequired, TypedDict
+from typing import NotRequired, Optional, Tuple, TypedDict
 
 import torch
 from torch import nn
 
 from convlstm.model import ConvLSTMParams
+from core.constants import CHANNELS_LAST_3D
+from core.layer_norm import ChannelLayerNorm
 from self_attention_convlstm.model import SAConvLSTM
 
 
@@ -14,6 +16,8 @@ class SASeq2SeqParams(TypedDict):
     num_kernels: int
     return_sequences: NotRequired[bool]
     convlstm_params: ConvLSTMParams
+    compile: NotRequired[bool]
+    use_logits: NotRequired[bool]
 
 
 class SASeq2Seq(nn.Module):
@@ -27,6 +31,8 @@ class SASeq2Seq(nn.Module):
         num_kernels: int,
         convlstm_params: ConvLSTMParams,
         return_sequences: bool = False,
+        compile: bool = False,
+        use_logits: bool = False,
     ) -> None:
         """
 
@@ -37,6 +43,8 @@ class SASeq2Seq(nn.Module):
             num_kernels (int): Number of kernels.
             return_sequences (int): If True, the model predict the next frames that is the same length of inputs. If False, the model predicts only one next frame.
             convlstm_params (ConvLSTMParams): Parameters for ConvLSTM module.
+            compile (bool): If True, the layers are compiled with `torch.compile` so that the element-wise kernels (e.g. ConvLSTM gates, LayerNorm and activation) are fused.
+            use_logits (bool): If True, the model outputs logits without the final sigmoid (e.g. for `nn.BCEWithLogitsLoss`).
         """
         super().__init__()
         self.attention_hidden_dims = attention_hidden_dims
@@ -44,6 +52,7 @@ class SASeq2Seq(nn.Module):
         self.num_layers = num_layers
         self.num_kernels = num_kernels
         self.return_sequences = return_sequences
+        self.use_logits = use_logits
         self.in_channels = convlstm_params["in_channels"]
         self.kernel_size = convlstm_params["kernel_size"]
         self.padding = convlstm_params["padding"]
@@ -72,7 +81,7 @@ class SASeq2Seq(nn.Module):
 
         self.sequential.add_module(
             "layernorm1",
-            nn.LayerNorm([self.num_kernels, self.input_seq_length, *self.frame_size]),
+            ChannelLayerNorm(self.num_kernels),
         )
 
         # Add the rest of the layers
@@ -95,39 +104,134 @@ class SASeq2Seq(nn.Module):
 
             self.sequential.add_module(
                 f"layernorm{layer_idx}",
-                nn.LayerNorm(
-                    [self.num_kernels, self.input_seq_length, *self.frame_size]
-                ),
+                ChannelLayerNorm(self.num_kernels),
             )
 
-        self.sequential.add_module(
-            "conv3d",
-            nn.Conv3d(
-                in_channels=self.num_kernels,
-                out_channels=self.out_channels,
-                kernel_size=(3, 3, 3),
-                padding="same",
-            ),
+        conv3d = nn.Conv3d(
+            in_channels=self.num_kernels,
+            out_channels=self.out_channels,
+            kernel_size=(3, 3, 3),
+            padding="same",
+        )
+        # NOTE: The output of `ChannelLayerNorm` is already laid out in channels_last_3d,
+        # so converting the weights lets cuDNN run NDHWC kernels without any layout conversion.
+        if CHANNELS_LAST_3D:
+            conv3d.weight.data = conv3d.weight.data.contiguous(
+                memory_format=torch.channels_last_3d
+            )
+        self.sequential.add_module("conv3d", conv3d)
+
+        if not self.use_logits:
+            self.sequential.add_module("sigmoid", nn.Sigmoid())
+
+        # Cache SAConvLSTM layers to avoid traversing all modules in every `get_attention_maps` call.
+        self._sa_convlstm_modules = [
+            (f"sequential.{name}", module)
+            for name, module in self.sequential.named_children()
+            if isinstance(module, SAConvLSTM)
+        ]
+
+        self._cuda_graph: Optional[
+            Tuple[torch.cuda.CUDAGraph, torch.Tensor, torch.Tensor]
+        ] = None
+
+        # NOTE: The layers of a single layer model (i.e. sa_convlstm1, layernorm1, conv3d and the optional sigmoid)
+        # are called directly to skip the dispatch of nn.Sequential. Hooks and modules added to or replaced
+        # in `self.sequential` after construction are not seen by this path.
+        self._single_layer_modules: Optional[Tuple[nn.Module, nn.Module, nn.Module]] = (
+            None
         )
+        if self.num_layers == 1 and not compile:
+            assert len(self.sequential) == (3 if self.use_logits else 4)
+            self._single_layer_modules = (
+                self.sequential.get_submodule("sa_convlstm1"),
+                self.sequential.get_submodule("layernorm1"),
+                self.sequential.get_submodule("conv3d"),
+            )
 
-        self.sequential.add_module("sigmoid", nn.Sigmoid())
+        self._compiled = compile
+        if compile:
+            # NOTE: Compile in place to keep the keys of the state dict the same as the eager model.
+            self.sequential.compile(mode="reduce-overhead")
 
     def forward(self, X: torch.Tensor):
-        # Forward propagation through all the layers
-        output = self.sequential(X)
+        if self.__can_replay_cuda_graph(X):
+            output = self.__replay_cuda_graph(X)
+        elif self._single_layer_modules is not None:
+            convlstm, layernorm, conv3d = self._single_layer_modules
+            output = conv3d(layernorm(convlstm(X)))
+            if not self.use_logits:
+                output = output.sigmoid_()
+        else:
+            # Forward propagation through all the layers
+            output = self.sequential(X)
 
         if self.return_sequences is True:
             return output
 
         return output[:, :, -1:, ...]
 
+    def capture_cuda_graph(self, sample_input: torch.Tensor) -> None:
+        """Capture the forward propagation into a CUDA graph to replay it without the Python overhead.
+
+        The graph is replayed in inference (i.e. gradients are disabled) with inputs of the same shape
+        as `sample_input`. Otherwise the forward propagation falls back to eager mode.
+        Note that the mode of the model (training or evaluation) is fixed at capture time.
+        A model built with `compile=True` cannot be captured because `torch.compile` already manages its own CUDA graphs.
+
+        Args:
+            sample_input (torch.Tensor): CUDA tensor with the shape of (batch_size, num_channels, seq_len, height, width)
+        """
+        if self._compiled:
+            raise ValueError(
+                "A model built with `compile=True` already runs with CUDA graphs of `torch.compile`."
+            )
+        if not sample_input.is_cuda:
+            raise ValueError("`sample_input` should be a CUDA tensor.")
+
+        static_input = sample_input.clone()
+        with torch.no_grad():
+            # Warm up on a side stream before capturing.
+            stream = torch.cuda.Stream()
+            stream.wait_stream(torch.cuda.current_stream())
+            with torch.cuda.stream(stream):
+                for _ in range(3):
+                    self.sequential(static_input)
+            torch.cuda.current_stream().wait_stream(stream)
+
+            graph = torch.cuda.CUDAGraph()
+            with torch.cuda.graph(graph):
+                static_output = self.sequential(static_input)
+
+        self._cuda_graph = (graph, static_input, static_output)
+
+    def __can_replay_cuda_graph(self, X: torch.Tensor) -> bool:
+        if self._cuda_graph is None or torch.is_grad_enabled():
+            return False
+        _, static_input, _ = self._cuda_graph
+        return (
+            X.shape == static_input.shape
+            and X.dtype == static_input.dtype
+            and X.device == static_input.device
+        )
+
+    def __replay_cuda_graph(self, X: torch.Tensor) -> torch.Tensor:
+        assert self._cuda_graph is not None
+        graph, static_input, static_output = self._cuda_graph
+        static_input.copy_(X)
+        graph.replay()
+        # NOTE: Clone the output because it is overwritten in the next replay.
+        return static_output.clone()
+
+    def set_store_attention_maps(self, store_attention_maps: bool) -> None:
+        """Set whether the attention maps are stored for `get_attention_maps` in the forward propagation.
+
+        Storing them needs the explicit attention matrix instead of the fused kernel, so it is disabled by default.
+        """
+        for _, module in self._sa_convlstm_modules:
+            module.store_attention_maps = store_attention_maps
+
     def get_attention_maps(self):
-        # get all sa_convlstm module
-        sa_convlstm_modules = [
-            (name, module)
-            for name, module in self.named_modules()
-            if module.__class__.__name__ == "SAConvLSTM"
-        ]
         return {
-            name: module.attention_scores for name, module in sa_convlstm_modules
+            name: module.attention_scores for name, module in self._sa_convlstm_modules
         }  # attention scores shape is (batch_size, seq_length, height * width)
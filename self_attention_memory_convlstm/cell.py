@@ -3,7 +3,7 @@ from typing import Tuple, Union
 import torch
 from torch import nn
 
-from core.constants import DEVICE, WeightsInitializer
+from core.constants import WeightsInitializer
 from core.convlstm_cell import BaseConvLSTMCell
 from self_attention_memory_convlstm.self_attention_memory import (
     SelfAttentionMemory,
@@ -43,9 +43,4 @@ class SAMConvLSTMCell(nn.Module):
     ) -> Tuple:
         new_h, new_cell = self.convlstm_cell(X, prev_h, prev_cell)
         new_h, new_memory, attention_h = self.attention_memory(new_h, prev_memory)
-        return (
-            new_h.to(DEVICE),
-            new_cell.to(DEVICE),
-            new_memory.to(DEVICE),
-            attention_h.to(DEVICE),
-        )
+        return new_h, new_cell, new_memory, attention_h
@@ -4,7 +4,7 @@ import torch
 from torch import nn
 
 from convlstm.model import ConvLSTMParams
-from core.constants import DEVICE
+from core.autocast import get_output_dtype
 from self_attention_memory_convlstm.cell import (
     SAMConvLSTMCell,
 )
@@ -49,26 +49,34 @@ class SAMConvLSTM(nn.Module):
         # NOTE: Cannot store all attention scores because of memory. So only store attention map of the center.
         # And the same attention score are applied to each channels.
         self._attention_scores = torch.zeros(
-            (batch_size, seq_len, height * width), device=DEVICE
+            (batch_size, seq_len, height * width), device=X.device, dtype=X.dtype
         )
 
         if h is None:
             h = torch.zeros(
-                (batch_size, self.out_channels, height, width), device=DEVICE
+                (batch_size, self.out_channels, height, width),
+                device=X.device,
+                dtype=X.dtype,
             )
 
         if cell is None:
             cell = torch.zeros(
-                (batch_size, self.out_channels, height, width), device=DEVICE
+                (batch_size, self.out_channels, height, width),
+                device=X.device,
+                dtype=X.dtype,
             )
 
         if memory is None:
             memory = torch.zeros(
-                (batch_size, self.out_channels, height, width), device=DEVICE
+                (batch_size, self.out_channels, height, width),
+                device=X.device,
+                dtype=X.dtype,
             )
 
         output = torch.zeros(
-            (batch_size, self.out_channels, seq_len, height, width), device=DEVICE
+            (batch_size, self.out_channels, seq_len, height, width),
+            device=X.device,
+            dtype=get_output_dtype(X),
         )
 
         for time_step in range(seq_len):
@@ -80,8 +88,9 @@ class SAMConvLSTM(nn.Module):
             # Save attention maps of the center point because storing
             # the full `attention_h` is difficult because of the lot of memory usage.
             # `attention_h` shape is (batch_size, height*width, height*width)
+            # Detach attention maps not to keep the computational graph alive.
             self._attention_scores[:, time_step] = attention_h[
                 :, attention_h.size(0) // 2
-            ]
+            ].detach()
 
         return output
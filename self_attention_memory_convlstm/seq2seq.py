@@ -14,6 +14,8 @@ class SAMSeq2SeqParams(TypedDict):
     num_kernels: int
     return_sequences: NotRequired[bool]
     convlstm_params: ConvLSTMParams
+    compile: NotRequired[bool]
+    use_logits: NotRequired[bool]
 
 
 class SAMSeq2Seq(nn.Module):
@@ -25,6 +27,8 @@ class SAMSeq2Seq(nn.Module):
         num_kernels: int,
         convlstm_params: ConvLSTMParams,
         return_sequences: bool = False,
+        compile: bool = False,
+        use_logits: bool = False,
     ):
         """
 
@@ -35,6 +39,8 @@ class SAMSeq2Seq(nn.Module):
             num_kernels (int): Number of kernels.
             return_sequences (int): If True, the model predict the next frames that is the same length of inputs. If False, the model predicts only one next frame.
             convlstm_params (ConvLSTMParams): Parameters for ConvLSTM module.
+            compile (bool): If True, the layers are compiled with `torch.compile` so that the element-wise kernels (e.g. ConvLSTM gates, LayerNorm and activation) are fused.
+            use_logits (bool): If True, the model outputs logits without the final sigmoid (e.g. for `nn.BCEWithLogitsLoss`).
         """
         super().__init__()
         self.attention_hidden_dims = attention_hidden_dims
@@ -42,6 +48,7 @@ class SAMSeq2Seq(nn.Module):
         self.num_layers = num_layers
         self.num_kernels = num_kernels
         self.return_sequences = return_sequences
+        self.use_logits = use_logits
         self.in_channels = convlstm_params["in_channels"]
         self.kernel_size = convlstm_params["kernel_size"]
         self.padding = convlstm_params["padding"]
@@ -104,7 +111,19 @@ class SAMSeq2Seq(nn.Module):
             ),
         )
 
-        self.sequential.add_module("sigmoid", nn.Sigmoid())
+        if not self.use_logits:
+            self.sequential.add_module("sigmoid", nn.Sigmoid())
+
+        # Cache SAMConvLSTM layers to avoid traversing all modules in every `get_attention_maps` call.
+        self._sam_convlstm_modules = [
+            (f"sequential.{name}", module)
+            for name, module in self.sequential.named_children()
+            if isinstance(module, SAMConvLSTM)
+        ]
+
+        if compile:
+            # NOTE: Compile in place to keep the keys of the state dict the same as the eager model.
+            self.sequential.compile(mode="reduce-overhead")
 
     def forward(self, X: torch.Tensor) -> torch.Tensor:
         output = self.sequential(X)
@@ -115,12 +134,6 @@ class SAMSeq2Seq(nn.Module):
         return output[:, :, -1:, :, :]
 
     def get_attention_maps(self):
-        # get all sa_convlstm module
-        sam_convlstm_modules = [
-            (name, module)
-            for name, module in self.named_modules()
-            if module.__class__.__name__ == "SAMConvLSTM"
-        ]
         return {
-            name: module.attention_scores for name, module in sam_convlstm_modules
+            name: module.attention_scores for name, module in self._sam_convlstm_modules
         }  # attention scores shape is (batch_size, seq_length, height * width)
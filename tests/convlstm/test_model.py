@@ -14,6 +14,41 @@ def test_ConvLSTM():
         "frame_size": (8, 8),
         "weights_initializer": WeightsInitializer.He,
     }
-    model = ConvLSTM(**model_params)
+    model = ConvLSTM(**model_params).to(DEVICE)
     output = model(torch.rand((2, 1, 3, 8, 8), dtype=torch.float, device=DEVICE))
     assert output.size() == (2, 1, 3, 8, 8)
+
+
+def test_ConvLSTM_parameters():
+    model_params: ConvLSTMParams = {
+        "in_channels": 1,
+        "out_channels": 1,
+        "kernel_size": 3,
+        "padding": 1,
+        "activation": "relu",
+        "frame_size": (8, 8),
+        "weights_initializer": WeightsInitializer.He,
+    }
+    model = ConvLSTM(**model_params).to(device=DEVICE, dtype=torch.float)
+    parameters = dict(model.named_parameters())
+    # The peephole weights are trained as well as the convolution weights.
+    for name in ["W_ci", "W_co", "W_cf", "conv.weight"]:
+        assert f"ConvLSTMCell.{name}" in parameters
+        assert parameters[f"ConvLSTMCell.{name}"].device.type == DEVICE
+
+
+def test_ConvLSTM_follows_input():
+    model_params: ConvLSTMParams = {
+        "in_channels": 1,
+        "out_channels": 1,
+        "kernel_size": 3,
+        "padding": 1,
+        "activation": "relu",
+        "frame_size": (8, 8),
+        "weights_initializer": WeightsInitializer.He,
+    }
+    # The states are allocated on the device and in the dtype of the input, not the global DEVICE.
+    model = ConvLSTM(**model_params).to(dtype=torch.double)
+    output = model(torch.rand((2, 1, 3, 8, 8), dtype=torch.double))
+    assert output.device.type == "cpu"
+    assert output.dtype == torch.double
@@ -27,7 +27,7 @@ def test_seq2seq(return_sequences: bool, expected_output_size: Tuple):
             "weights_initializer": WeightsInitializer.He,
         },
     }
-    model = Seq2Seq(**model_params).to(DEVICE).to(torch.float)
+    model = Seq2Seq(**model_params).to(device=DEVICE, dtype=torch.float)
     output = model(torch.rand((2, 1, 2, 8, 8), dtype=torch.float, device=DEVICE))
     assert output.size() == expected_output_size
 
@@ -50,7 +50,7 @@ def test_seq2seq_label_seq_length():
             "weights_initializer": WeightsInitializer.He,
         },
     }
-    model = Seq2Seq(**model_params).to(DEVICE).to(torch.float)
+    model = Seq2Seq(**model_params).to(device=DEVICE, dtype=torch.float)
     output = model(torch.rand((2, 1, 4, 8, 8), dtype=torch.float, device=DEVICE))
     assert output.size() == (2, 1, label_seq_length, 8, 8)
 
@@ -71,7 +71,7 @@ def test_seq2seq_label_seq_length():
             "weights_initializer": WeightsInitializer.He,
         },
     }
-    model = Seq2Seq(**model_params).to(DEVICE).to(torch.float)
+    model = Seq2Seq(**model_params).to(device=DEVICE, dtype=torch.float)
     output = model(torch.rand((2, 1, 4, 8, 8), dtype=torch.float, device=DEVICE))
     # the output has the same frames as the given dataset.
     assert output.size() == (2, 1, 4, 8, 8)
@@ -93,7 +93,88 @@ def test_seq2seq_label_seq_length():
             "weights_initializer": WeightsInitializer.He,
         },
     }
-    model = Seq2Seq(**model_params).to(DEVICE).to(torch.float)
+    model = Seq2Seq(**model_params).to(device=DEVICE, dtype=torch.float)
     output = model(torch.rand((2, 1, 4, 8, 8), dtype=torch.float, device=DEVICE))
     # the priority of `return_sequences` is higher than that of `label_seq_length`.
     assert output.size() == (2, 1, 4, 8, 8)
+
+
+def test_seq2seq_compile():
+    model_params: Seq2SeqParams = {
+        "input_seq_length": 2,
+        "num_layers": 1,
+        "num_kernels": 4,
+        "return_sequences": True,
+        "convlstm_params": {
+            "in_channels": 1,
+            "out_channels": 1,
+            "kernel_size": 3,
+            "padding": 1,
+            "activation": "relu",
+            "frame_size": (8, 8),
+            "weights_initializer": WeightsInitializer.He,
+        },
+        "compile": True,
+    }
+
+    model = Seq2Seq(**model_params).to(device=DEVICE, dtype=torch.float)
+    output = model(torch.rand((2, 1, 2, 8, 8), dtype=torch.float, device=DEVICE))
+    assert output.size() == (2, 1, 2, 8, 8)
+
+
+@pytest.mark.parametrize(
+    "return_sequences, expected_output_size",
+    [(True, (2, 1, 2, 8, 8)), (False, (2, 1, 1, 8, 8))],
+)
+def test_seq2seq_single_layer(return_sequences: bool, expected_output_size: Tuple):
+    model_params: Seq2SeqParams = {
+        "input_seq_length": 2,
+        "num_layers": 1,
+        "num_kernels": 4,
+        "return_sequences": return_sequences,
+        "convlstm_params": {
+            "in_channels": 1,
+            "out_channels": 1,
+            "kernel_size": 3,
+            "padding": 1,
+            "activation": "relu",
+            "frame_size": (8, 8),
+            "weights_initializer": WeightsInitializer.He,
+        },
+    }
+
+    model = Seq2Seq(**model_params).to(device=DEVICE, dtype=torch.float)
+    X = torch.rand((2, 1, 2, 8, 8), dtype=torch.float, device=DEVICE)
+    output = model(X)
+    assert output.size() == expected_output_size
+    # The layers called directly give the same output as nn.Sequential.
+    expected = model.sequential(X)
+    if not return_sequences:
+        expected = expected[:, :, -1:]
+    assert torch.allclose(output, expected, atol=1e-6)
+
+
+def test_seq2seq_use_logits():
+    model_params: Seq2SeqParams = {
+        "input_seq_length": 2,
+        "num_layers": 1,
+        "num_kernels": 4,
+        "return_sequences": True,
+        "convlstm_params": {
+            "in_channels": 1,
+            "out_channels": 1,
+            "kernel_size": 3,
+            "padding": 1,
+            "activation": "relu",
+            "frame_size": (8, 8),
+            "weights_initializer": WeightsInitializer.He,
+        },
+    }
+
+    model = Seq2Seq(**model_params).to(device=DEVICE, dtype=torch.float)
+    model_params["use_logits"] = True
+    logits_model = Seq2Seq(**model_params).to(device=DEVICE, dtype=torch.float)
+    logits_model.load_state_dict(model.state_dict())
+    assert not hasattr(logits_model.sequential, "sigmoid")
+    X = torch.rand((2, 1, 2, 8, 8), dtype=torch.float, device=DEVICE)
+    assert torch.allclose(torch.sigmoid(logits_model(X)), model(X), atol=1e-6)
@@ -0,0 +1,30 @@
+import torch
+from torch.nn import functional as F
+
+from core.layer_norm import ChannelLayerNorm
+
+
+def test_ChannelLayerNorm():
+    X = torch.rand((2, 4, 3, 8, 8), dtype=torch.float)
+    layer_norm = ChannelLayerNorm(4)
+    output = layer_norm(X)
+    assert output.size() == X.size()
+    expected = F.layer_norm(X.permute(0, 2, 3, 4, 1), (4,)).permute(0, 4, 1, 2, 3)
+    assert torch.allclose(output, expected, atol=1e-6)
+    assert layer_norm.weight.size() == (4,)
+    # The output is laid out in channels_last_3d.
+    assert output.is_contiguous(memory_format=torch.channels_last_3d)
+
+
+def test_ChannelLayerNorm_autocast():
+    X = torch.rand((2, 4, 3, 8, 8), dtype=torch.bfloat16, requires_grad=True)
+    layer_norm = ChannelLayerNorm(4)
+    with torch.autocast("cpu", dtype=torch.bfloat16):
+        output = layer_norm(X)
+    # The half precision input is not upcasted to float32.
+    assert output.dtype == torch.bfloat16
+    expected = layer_norm(X.float())
+    assert torch.allclose(output.float(), expected, atol=5e-2)
+    output.float().sum().backward()
+    assert layer_norm.weight.grad is not None
+    assert layer_norm.weight.grad.dtype == torch.float
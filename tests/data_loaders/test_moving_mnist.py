@@ -1,8 +1,12 @@
+import os
+import tempfile
 from unittest.mock import patch
 
 import pytest
+import torch
+from torch import distributed as dist
 
-from data_loaders.moving_mnist import MovingMNISTDataLoaders
+from data_loaders.moving_mnist import FramesDataset, MovingMNISTDataLoaders
 from tests.utils import MockMovingMNIST
 
 
@@ -71,6 +75,27 @@ def test_MovingMNISTDataLoaders_set_validation_batch_size(mocked_MovingMNIST):
     assert target.size(2) == label_frames
 
 
+@patch("data_loaders.moving_mnist.MovingMNIST")
+def test_MovingMNISTDataLoaders_set_num_workers(mocked_MovingMNIST):
+    dataset_length = 10
+    train_batch_size = 2
+    input_frames = 10
+    num_workers = 1
+    mocked_MovingMNIST.return_value = MockMovingMNIST(dataset_length=dataset_length)
+    dataloaders = MovingMNISTDataLoaders(
+        train_batch_size=train_batch_size,
+        input_frames=input_frames,
+        num_workers=num_workers,
+    )
+    train_dataloader = dataloaders.train_dataloader
+    assert train_dataloader.num_workers == num_workers
+    assert train_dataloader.persistent_workers is True
+    assert len(train_dataloader) == 4
+    input, target = next(iter(train_dataloader))
+    assert input.size(0) == train_batch_size
+    assert target.size(0) == train_batch_size
+
+
 @patch("data_loaders.moving_mnist.MovingMNIST")
 def test_MovingMNISTDataLoaders_set_split_ratio(mocked_MovingMNIST):
     dataset_length = 10
@@ -100,3 +125,53 @@ def test_MovingMNISTDataLoaders_set_split_ratio(mocked_MovingMNIST):
     assert len(dataloaders.train_dataloader) == 6
     assert len(dataloaders.validation_dataloader) == 2
     assert len(dataloaders.test_dataloader) == 2
+
+
+def test_FramesDataset():
+    frames = torch.randint(0, 256, (4, 20, 1, 8, 8), dtype=torch.uint8)
+    dataset = FramesDataset(frames, [3, 1])
+    assert len(dataset) == 2
+    assert torch.allclose(dataset[0], frames[3] / 255.0)
+    batch = dataset[[0, 1]]
+    assert batch.size() == (2, 20, 1, 8, 8)
+    assert batch.dtype == torch.float32
+    assert torch.allclose(batch, frames[[3, 1]] / 255.0)
+
+
+@patch("data_loaders.moving_mnist.MovingMNIST")
+def test_MovingMNISTDataLoaders_distributed(mocked_MovingMNIST):
+    mocked_MovingMNIST.return_value = MockMovingMNIST(dataset_length=10)
+    with tempfile.TemporaryDirectory() as tempdirpath:
+        dist.init_process_group(
+            "gloo",
+            init_method=f"file://{os.path.join(tempdirpath, 'store')}",
+            rank=0,
+            world_size=1,
+        )
+        try:
+            dataloaders = MovingMNISTDataLoaders(train_batch_size=2, num_workers=0)
+        finally:
+            dist.destroy_process_group()
+    mocked_MovingMNIST.assert_called_once()
+    assert len(dataloaders.train_dataset) == 7
+
+
+@pytest.mark.parametrize(
+    "local_world_size, expected_num_workers", [(None, 4), ("2", 4), ("4", 2)]
+)
+@patch("data_loaders.moving_mnist.os.cpu_count", return_value=16)
+@patch("data_loaders.moving_mnist.MovingMNIST")
+def test_MovingMNISTDataLoaders_default_num_workers(
+    mocked_MovingMNIST,
+    _,
+    monkeypatch,
+    local_world_size,
+    expected_num_workers,
+):
+    if local_world_size is None:
+        monkeypatch.delenv("LOCAL_WORLD_SIZE", raising=False)
+    else:
+        monkeypatch.setenv("LOCAL_WORLD_SIZE", local_world_size)
+    mocked_MovingMNIST.return_value = MockMovingMNIST(dataset_length=10)
+    dataloaders = MovingMNISTDataLoaders(train_batch_size=2)
+    assert dataloaders.num_workers == expected_num_workers
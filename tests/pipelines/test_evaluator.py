@@ -4,7 +4,9 @@ from unittest.mock import MagicMock
 
 import torch
 
+from core.constants import WeightsInitializer
 from pipelines.evaluator import Evaluator
+from self_attention_convlstm.seq2seq import SASeq2Seq
 from tests.test_model.model import TestModel
 from tests.utils import mock_data_loader
 
@@ -22,6 +24,7 @@ def test_run_return_sequences():
             artifact_dir=tempdirpath,
         )
         evaluator.run()
+        assert model.training is False
         for i in range(dataset_length):
             assert os.path.exists(os.path.join(tempdirpath, f"test-case{i}.png"))
 
@@ -70,3 +73,50 @@ def test_run_save_attention_maps():
                     "attentionmaps.png",
                 )
             )
+
+
+def test_init_save_attention_maps():
+    model = SASeq2Seq(
+        attention_hidden_dims=1,
+        input_seq_length=2,
+        num_layers=1,
+        num_kernels=4,
+        convlstm_params={
+            "in_channels": 1,
+            "out_channels": 1,
+            "kernel_size": 3,
+            "padding": 1,
+            "activation": "relu",
+            "frame_size": (8, 8),
+            "weights_initializer": WeightsInitializer.He,
+        },
+    )
+    with tempfile.TemporaryDirectory() as tempdirpath:
+        Evaluator(model, test_dataloader=data_loader, artifact_dir=tempdirpath)
+        assert model.sequential.sa_convlstm1.store_attention_maps is False
+        Evaluator(
+            model,
+            test_dataloader=data_loader,
+            artifact_dir=tempdirpath,
+            save_attention_maps=True,
+        )
+        assert model.sequential.sa_convlstm1.store_attention_maps is True
+
+
+def test_run_save_attention_maps_without_stored_maps():
+    with tempfile.TemporaryDirectory() as tempdirpath:
+        model = TestModel(return_sequences=True)
+        model.get_attention_maps = MagicMock(return_value={"layer1": None})
+        model.frame_size = (64, 64)
+
+        evaluator = Evaluator(
+            model,
+            test_dataloader=data_loader,
+            artifact_dir=tempdirpath,
+            save_attention_maps=True,
+        )
+        evaluator.run()
+        # Layers without stored attention maps are skipped.
+        assert not os.path.exists(
+            os.path.join(tempdirpath, "attention_maps", "test-case0", "layer1")
+        )
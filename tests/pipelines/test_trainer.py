@@ -1,7 +1,9 @@
 import os
 import tempfile
 
-from torch import nn
+import pytest
+import torch
+from torch import distributed as dist, nn
 from torch.optim import Adam
 
 from pipelines.trainer import Trainer
@@ -34,6 +36,7 @@ def test_run():
         trainer.run()
 
         assert os.path.exists(os.path.join(tempdirpath, "checkpoint.pt"))
+        assert not os.path.exists(os.path.join(tempdirpath, "checkpoint.pt.tmp"))
         assert os.path.exists(os.path.join(tempdirpath, "example.csv"))
         assert os.path.exists(os.path.join(tempdirpath, "learning_curve.png"))
         for metrics in trainer.training_metrics.values():
@@ -69,3 +72,69 @@ def test_run_early_stopping():
         assert os.path.exists(os.path.join(tempdirpath, "learning_curve.png"))
         for metrics in trainer.training_metrics.values():
             assert len(metrics) == epochs - patience
+
+
+@pytest.mark.parametrize("autocast_dtype", [torch.bfloat16, torch.float16])
+def test_run_autocast(autocast_dtype: torch.dtype):
+    with tempfile.TemporaryDirectory() as tempdirpath:
+        model = TestModel()
+        epochs = 2
+        trainer = Trainer(
+            model=model,
+            train_epochs=epochs,
+            train_dataloader=mock_data_loader(),
+            validation_dataloader=mock_data_loader(),
+            loss_criterion=nn.BCELoss(),
+            accuracy_criterion=nn.L1Loss(),
+            optimizer=Adam(model.parameters(), lr=0.0005),
+            early_stopping=EarlyStopping(
+                patience=30,
+                verbose=True,
+                delta=0.0001,
+                model_save_path=os.path.join(tempdirpath, "checkpoint.pt"),
+            ),
+            artifact_dir=tempdirpath,
+            metrics_filename="example.csv",
+            autocast_dtype=autocast_dtype,
+        )
+        trainer.run()
+
+        assert os.path.exists(os.path.join(tempdirpath, "checkpoint.pt"))
+        assert len(trainer.training_metrics["train_loss"]) == epochs
+
+
+def test_run_distributed():
+    with tempfile.TemporaryDirectory() as tempdirpath:
+        dist.init_process_group(
+            "gloo",
+            init_method=f"file://{os.path.join(tempdirpath, 'store')}",
+            rank=0,
+            world_size=1,
+        )
+        try:
+            model = TestModel()
+            epochs = 2
+            trainer = Trainer(
+                model=model,
+                train_epochs=epochs,
+                train_dataloader=mock_data_loader(),
+                validation_dataloader=mock_data_loader(),
+                loss_criterion=nn.MSELoss(),
+                accuracy_criterion=nn.L1Loss(),
+                optimizer=Adam(model.parameters(), lr=0.0005),
+                early_stopping=EarlyStopping(
+                    patience=30,
+                    verbose=True,
+                    delta=0.0001,
+                    model_save_path=os.path.join(tempdirpath, "checkpoint.pt"),
+                ),
+                artifact_dir=tempdirpath,
+                metrics_filename="example.csv",
+            )
+            trainer.run()
+        finally:
+            dist.destroy_process_group()
+
+        assert os.path.exists(os.path.join(tempdirpath, "checkpoint.pt"))
+        assert os.path.exists(os.path.join(tempdirpath, "example.csv"))
+        assert len(trainer.training_metrics["train_loss"]) == epochs
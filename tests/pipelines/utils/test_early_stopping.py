@@ -0,0 +1,43 @@
+import os
+import tempfile
+
+import pytest
+import torch
+from torch import nn
+
+from pipelines.utils.early_stopping import EarlyStopping
+
+
+@pytest.mark.parametrize(
+    "device",
+    [
+        "cpu",
+        pytest.param(
+            "cuda",
+            marks=pytest.mark.skipif(
+                not torch.cuda.is_available(), reason="CUDA is not available"
+            ),
+        ),
+    ],
+)
+def test_save_checkpoint(device: str):
+    with tempfile.TemporaryDirectory() as tempdirpath:
+        model_save_path = os.path.join(tempdirpath, "checkpoint.pt")
+        early_stopping = EarlyStopping(model_save_path=model_save_path)
+        model = nn.Linear(4, 2).to(device)
+
+        early_stopping(1.0, model)
+        # The checkpoint keeps the parameters at the time of saving.
+        with torch.no_grad():
+            model.weight.add_(1.0)
+        expected = {k: v.cpu().clone() for k, v in model.state_dict().items()}
+        early_stopping(0.5, model)
+        with torch.no_grad():
+            model.weight.add_(1.0)
+        early_stopping.wait_for_checkpoint()
+
+        checkpoint = torch.load(model_save_path)
+        assert checkpoint.keys() == expected.keys()
+        for key, value in checkpoint.items():
+            assert value.device.type == "cpu"
+            assert torch.equal(value, expected[key])
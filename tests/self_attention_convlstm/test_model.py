@@ -17,6 +17,54 @@ def test_ConvLSTM():
             "weights_initializer": WeightsInitializer.He,
         },
     }
-    model = SAConvLSTM(**model_params)
+    model = SAConvLSTM(**model_params).to(DEVICE)
     output = model(torch.rand((2, 1, 3, 8, 8), dtype=torch.float, device=DEVICE))
     assert output.size() == (2, 1, 3, 8, 8)
+
+
+def test_ConvLSTM_store_attention_maps():
+    model_params: SAConvLSTMParams = {
+        "attention_hidden_dims": 1,
+        "convlstm_params": {
+            "in_channels": 1,
+            "out_channels": 1,
+            "kernel_size": 3,
+            "padding": 1,
+            "activation": "relu",
+            "frame_size": (8, 8),
+            "weights_initializer": WeightsInitializer.He,
+        },
+    }
+    model = SAConvLSTM(**model_params).to(DEVICE)
+    model.store_attention_maps = True
+    model(torch.rand((2, 1, 3, 8, 8), dtype=torch.float, device=DEVICE))
+    assert model.attention_scores is not None
+    assert model.attention_scores.size() == (2, 3, 8 * 8)
+
+    # Stale attention maps are not kept.
+    model.store_attention_maps = False
+    model(torch.rand((2, 1, 3, 8, 8), dtype=torch.float, device=DEVICE))
+    assert model.attention_scores is None
+
+
+def test_ConvLSTM_follows_input():
+    model_params: SAConvLSTMParams = {
+        "attention_hidden_dims": 1,
+        "convlstm_params": {
+            "in_channels": 1,
+            "out_channels": 1,
+            "kernel_size": 3,
+            "padding": 1,
+            "activation": "relu",
+            "frame_size": (8, 8),
+            "weights_initializer": WeightsInitializer.He,
+        },
+    }
+    # The states are allocated on the device and in the dtype of the input, not the global DEVICE.
+    model = SAConvLSTM(**model_params).to(dtype=torch.double)
+    model.store_attention_maps = True
+    output = model(torch.rand((2, 1, 3, 8, 8), dtype=torch.double))
+    assert output.device.type == "cpu"
+    assert output.dtype == torch.double
+    assert model.attention_scores is not None
+    assert model.attention_scores.dtype == torch.double
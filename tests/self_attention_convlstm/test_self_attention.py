@@ -0,0 +1,33 @@
+import pytest
+import torch
+from torch.nn.attention import SDPBackend, sdpa_kernel
+
+from core.constants import DEVICE
+from self_attention_convlstm.self_attention import SelfAttention
+
+
+def test_SelfAttention():
+    model = SelfAttention(input_dim=4, hidden_dim=2).to(DEVICE)
+    h = torch.rand((2, 4, 8, 8), dtype=torch.float, device=DEVICE)
+
+    new_h, attention = model(h)
+    assert new_h.size() == (2, 4, 8, 8)
+    assert attention is None
+
+    # The fused attention gives the same result as the explicit attention matrix.
+    expected_h, attention = model(h, return_attention=True)
+    assert attention is not None
+    assert attention.size() == (2, 8 * 8, 8 * 8)
+    assert torch.allclose(new_h, expected_h, atol=1e-5)
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA is not available")
+def test_SelfAttention_fused_kernel():
+    model = SelfAttention(input_dim=16, hidden_dim=8).to("cuda")
+    h = torch.rand((2, 16, 8, 8), dtype=torch.float, device="cuda")
+
+    # Raises an error if the fused kernel cannot run the input.
+    with sdpa_kernel(SDPBackend.EFFICIENT_ATTENTION):
+        new_h, _ = model(h)
+    expected_h, _ = model(h, return_attention=True)
+    assert torch.allclose(new_h, expected_h, atol=1e-4)
@@ -1,7 +1,9 @@
 from typing import Tuple
+from unittest.mock import patch
 
 import pytest
 import torch
+from torch import nn
 
 from core.constants import DEVICE, WeightsInitializer
 from self_attention_convlstm.seq2seq import SASeq2Seq, SASeq2SeqParams
@@ -29,6 +31,270 @@ def test_seq2seq(return_sequences: bool, expected_output_size: Tuple):
         },
     }
 
-    model = SASeq2Seq(**model_params).to(DEVICE).to(torch.float)
+    model = SASeq2Seq(**model_params).to(device=DEVICE, dtype=torch.float)
     output = model(torch.rand((2, 1, 2, 8, 8), dtype=torch.float, device=DEVICE))
     assert output.size() == expected_output_size
+
+
+def test_seq2seq_compile():
+    model_params: SASeq2SeqParams = {
+        "attention_hidden_dims": 1,
+        "input_seq_length": 2,
+        "num_layers": 1,
+        "num_kernels": 4,
+        "return_sequences": True,
+        "convlstm_params": {
+            "in_channels": 1,
+            "out_channels": 1,
+            "kernel_size": 3,
+            "padding": 1,
+            "activation": "relu",
+            "frame_size": (8, 8),
+            "weights_initializer": WeightsInitializer.He,
+        },
+        "compile": True,
+    }
+
+    model = SASeq2Seq(**model_params).to(device=DEVICE, dtype=torch.float)
+    output = model(torch.rand((2, 1, 2, 8, 8), dtype=torch.float, device=DEVICE))
+    assert output.size() == (2, 1, 2, 8, 8)
+
+    # Checkpoints of the compiled model can be loaded into the eager one.
+    model_params["compile"] = False
+    SASeq2Seq(**model_params).load_state_dict(model.state_dict())
+
+
+@pytest.mark.parametrize("channels_last_3d", [True, False])
+def test_seq2seq_channels_last_3d(channels_last_3d: bool):
+    model_params: SASeq2SeqParams = {
+        "attention_hidden_dims": 1,
+        "input_seq_length": 2,
+        "num_layers": 1,
+        "num_kernels": 4,
+        "return_sequences": True,
+        "convlstm_params": {
+            "in_channels": 1,
+            "out_channels": 1,
+            "kernel_size": 3,
+            "padding": 1,
+            "activation": "relu",
+            "frame_size": (8, 8),
+            "weights_initializer": WeightsInitializer.He,
+        },
+    }
+
+    with patch("self_attention_convlstm.seq2seq.CHANNELS_LAST_3D", channels_last_3d):
+        model = SASeq2Seq(**model_params).to(device=DEVICE, dtype=torch.float)
+    conv3d = model.sequential.get_submodule("conv3d")
+    assert isinstance(conv3d, nn.Conv3d)
+    assert (
+        conv3d.weight.is_contiguous(memory_format=torch.channels_last_3d)
+        is channels_last_3d
+    )
+    output = model(torch.rand((2, 1, 2, 8, 8), dtype=torch.float, device=DEVICE))
+    assert output.size() == (2, 1, 2, 8, 8)
+
+
+def test_seq2seq_get_attention_maps():
+    model_params: SASeq2SeqParams = {
+        "attention_hidden_dims": 1,
+        "input_seq_length": 2,
+        "num_layers": 2,
+        "num_kernels": 4,
+        "convlstm_params": {
+            "in_channels": 1,
+            "out_channels": 1,
+            "kernel_size": 3,
+            "padding": 1,
+            "activation": "relu",
+            "frame_size": (8, 8),
+            "weights_initializer": WeightsInitializer.He,
+        },
+    }
+
+    model = SASeq2Seq(**model_params).to(device=DEVICE, dtype=torch.float)
+    # Attention maps are not stored by default.
+    model(torch.rand((2, 1, 2, 8, 8), dtype=torch.float, device=DEVICE))
+    assert all(v is None for v in model.get_attention_maps().values())
+
+    model.set_store_attention_maps(True)
+    model(torch.rand((2, 1, 2, 8, 8), dtype=torch.float, device=DEVICE))
+    attention_maps = model.get_attention_maps()
+    assert list(attention_maps.keys()) == [
+        "sequential.sa_convlstm1",
+        "sequential.sa_convlstm2",
+    ]
+    for attention_map in attention_maps.values():
+        assert attention_map is not None
+        assert attention_map.size() == (2, 2, 8 * 8)
+        assert attention_map.requires_grad is False
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA is not available")
+def test_seq2seq_capture_cuda_graph():
+    model_params: SASeq2SeqParams = {
+        "attention_hidden_dims": 1,
+        "input_seq_length": 2,
+        "num_layers": 2,
+        "num_kernels": 4,
+        "return_sequences": True,
+        "convlstm_params": {
+            "in_channels": 1,
+            "out_channels": 1,
+            "kernel_size": 3,
+            "padding": 1,
+            "activation": "relu",
+            "frame_size": (8, 8),
+            "weights_initializer": WeightsInitializer.He,
+        },
+    }
+
+    model = SASeq2Seq(**model_params).to(device="cuda", dtype=torch.float).eval()
+    X = torch.rand((2, 1, 2, 8, 8), dtype=torch.float, device="cuda")
+    model.capture_cuda_graph(X)
+    with torch.no_grad():
+        expected = model.sequential(X)
+        output = model(X)
+        # Fall back to eager mode if the shape is different.
+        assert model(X[:1]).size() == (1, 1, 2, 8, 8)
+    assert torch.allclose(output, expected, atol=1e-5)
+
+
+def test_seq2seq_capture_cuda_graph_with_cpu_tensor():
+    model_params: SASeq2SeqParams = {
+        "attention_hidden_dims": 1,
+        "input_seq_length": 2,
+        "num_layers": 1,
+        "num_kernels": 4,
+        "convlstm_params": {
+            "in_channels": 1,
+            "out_channels": 1,
+            "kernel_size": 3,
+            "padding": 1,
+            "activation": "relu",
+            "frame_size": (8, 8),
+            "weights_initializer": WeightsInitializer.He,
+        },
+    }
+
+    model = SASeq2Seq(**model_params)
+    with pytest.raises(ValueError):
+        model.capture_cuda_graph(torch.rand((2, 1, 2, 8, 8), dtype=torch.float))
+
+
+@pytest.mark.parametrize(
+    "return_sequences, expected_output_size",
+    [(True, (2, 1, 2, 8, 8)), (False, (2, 1, 1, 8, 8))],
+)
+def test_seq2seq_single_layer(return_sequences: bool, expected_output_size: Tuple):
+    model_params: SASeq2SeqParams = {
+        "attention_hidden_dims": 1,
+        "input_seq_length": 2,
+        "num_layers": 1,
+        "num_kernels": 4,
+        "return_sequences": return_sequences,
+        "convlstm_params": {
+            "in_channels": 1,
+            "out_channels": 1,
+            "kernel_size": 3,
+            "padding": 1,
+            "activation": "relu",
+            "frame_size": (8, 8),
+            "weights_initializer": WeightsInitializer.He,
+        },
+    }
+
+    model = SASeq2Seq(**model_params).to(device=DEVICE, dtype=torch.float)
+    X = torch.rand((2, 1, 2, 8, 8), dtype=torch.float, device=DEVICE)
+    output = model(X)
+    assert output.size() == expected_output_size
+    # The layers called directly give the same output as nn.Sequential.
+    expected = model.sequential(X)
+    if not return_sequences:
+        expected = expected[:, :, -1:]
+    assert torch.allclose(output, expected, atol=1e-6)
+
+
+@pytest.mark.parametrize("num_layers", [1, 2])
+def test_seq2seq_use_logits(num_layers: int):
+    model_params: SASeq2SeqParams = {
+        "attention_hidden_dims": 1,
+        "input_seq_length": 2,
+        "num_layers": num_layers,
+        "num_kernels": 4,
+        "return_sequences": True,
+        "convlstm_params": {
+            "in_channels": 1,
+            "out_channels": 1,
+            "kernel_size": 3,
+            "padding": 1,
+            "activation": "relu",
+            "frame_size": (8, 8),
+            "weights_initializer": WeightsInitializer.He,
+        },
+    }
+
+    model = SASeq2Seq(**model_params).to(device=DEVICE, dtype=torch.float)
+    model_params["use_logits"] = True
+    logits_model = SASeq2Seq(**model_params).to(device=DEVICE, dtype=torch.float)
+    logits_model.load_state_dict(model.state_dict())
+    assert not hasattr(logits_model.sequential, "sigmoid")
+    X = torch.rand((2, 1, 2, 8, 8), dtype=torch.float, device=DEVICE)
+    assert torch.allclose(torch.sigmoid(logits_model(X)), model(X), atol=1e-6)
+
+
+def test_seq2seq_autocast():
+    model_params: SASeq2SeqParams = {
+        "attention_hidden_dims": 1,
+        "input_seq_length": 2,
+        "num_layers": 2,
+        "num_kernels": 4,
+        "return_sequences": True,
+        "convlstm_params": {
+            "in_channels": 1,
+            "out_channels": 1,
+            "kernel_size": 3,
+            "padding": 1,
+            "activation": "relu",
+            "frame_size": (8, 8),
+            "weights_initializer": WeightsInitializer.He,
+        },
+    }
+
+    model = SASeq2Seq(**model_params)
+    layernorm_input_dtypes = []
+    for name, module in model.sequential.named_children():
+        if name.startswith("layernorm"):
+            module.register_forward_pre_hook(
+                lambda _, args: layernorm_input_dtypes.append(args[0].dtype)
+            )
+    with torch.autocast("cpu", dtype=torch.bfloat16):
+        output = model(torch.rand((2, 1, 2, 8, 8), dtype=torch.float))
+    assert output.size() == (2, 1, 2, 8, 8)
+    # LayerNorm reads half precision instead of float32.
+    assert layernorm_input_dtypes == [torch.bfloat16, torch.bfloat16]
+
+
+def test_seq2seq_capture_cuda_graph_with_compile():
+    model_params: SASeq2SeqParams = {
+        "attention_hidden_dims": 1,
+        "input_seq_length": 2,
+        "num_layers": 1,
+        "num_kernels": 4,
+        "convlstm_params": {
+            "in_channels": 1,
+            "out_channels": 1,
+            "kernel_size": 3,
+            "padding": 1,
+            "activation": "relu",
+            "frame_size": (8, 8),
+            "weights_initializer": WeightsInitializer.He,
+        },
+        "compile": True,
+    }
+
+    model = SASeq2Seq(**model_params).to(DEVICE)
+    with pytest.raises(ValueError):
+        model.capture_cuda_graph(
+            torch.rand((2, 1, 2, 8, 8), dtype=torch.float, device=DEVICE)
+        )
@@ -29,6 +29,60 @@ def test_seq2seq(return_sequences: bool, expected_output_size: Tuple):
         },
     }
 
-    model = SAMSeq2Seq(**model_params).to(DEVICE).to(torch.float)
+    model = SAMSeq2Seq(**model_params).to(device=DEVICE, dtype=torch.float)
     output = model(torch.rand((2, 1, 2, 8, 8), dtype=torch.float, device=DEVICE))
     assert output.size() == expected_output_size
+
+
+def test_seq2seq_get_attention_maps():
+    model_params: SAMSeq2SeqParams = {
+        "attention_hidden_dims": 1,
+        "input_seq_length": 2,
+        "num_layers": 2,
+        "num_kernels": 4,
+        "convlstm_params": {
+            "in_channels": 1,
+            "out_channels": 1,
+            "kernel_size": 3,
+            "padding": 1,
+            "activation": "relu",
+            "frame_size": (8, 8),
+            "weights_initializer": WeightsInitializer.He,
+        },
+    }
+
+    model = SAMSeq2Seq(**model_params).to(device=DEVICE, dtype=torch.float)
+    model(torch.rand((2, 1, 2, 8, 8), dtype=torch.float, device=DEVICE))
+    attention_maps = model.get_attention_maps()
+    assert list(attention_maps.keys()) == [
+        "sequential.sam-convlstm1",
+        "sequential.sam-convlstm2",
+    ]
+    for attention_map in attention_maps.values():
+        assert attention_map is not None
+        assert attention_map.size() == (2, 2, 8 * 8)
+        assert attention_map.requires_grad is False
+
+
+def test_seq2seq_compile():
+    model_params: SAMSeq2SeqParams = {
+        "attention_hidden_dims": 1,
+        "input_seq_length": 2,
+        "num_layers": 1,
+        "num_kernels": 4,
+        "return_sequences": True,
+        "convlstm_params": {
+            "in_channels": 1,
+            "out_channels": 1,
+            "kernel_size": 3,
+            "padding": 1,
+            "activation": "relu",
+            "frame_size": (8, 8),
+            "weights_initializer": WeightsInitializer.He,
+        },
+        "compile": True,
+    }
+
+    model = SAMSeq2Seq(**model_params).to(device=DEVICE, dtype=torch.float)
+    output = model(torch.rand((2, 1, 2, 8, 8), dtype=torch.float, device=DEVICE))
+    assert output.size() == (2, 1, 2, 8, 8)